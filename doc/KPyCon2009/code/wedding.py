@@ -29,18 +29,18 @@ x = pulp.LpVariable.dicts(
 
 seating_model = pulp.LpProblem("Wedding Seating Model", pulp.LpMinimize)
 
-seating_model += sum([happiness(table) * x[table] for table in possible_tables])
+seating_model += pulp.lpSum([happiness(table) * x[table] for table in possible_tables])
 
 # specify the maximum number of tables
 seating_model += (
-    sum([x[table] for table in possible_tables]) <= max_tables,
+    pulp.lpSum([x[table] for table in possible_tables]) <= max_tables,
     "Maximum_number_of_tables",
 )
 
 # A guest must seated at one and only one table
 for guest in guests:
     seating_model += (
-        sum([x[table] for table in possible_tables if guest in table]) == 1,
+        pulp.lpSum([x[table] for table in possible_tables if guest in table]) == 1,
         f"Must_seat_{guest}",
     )
 
@@ -82,13 +82,22 @@ for a in Arcs:
 prob = LpProblem("American Steel Problem", LpMinimize)
 
 # Creates the objective function
-prob += lpSum([vars[a] * costs[a] for a in Arcs]), "Total Cost of Transport"
+prob += (
+    LpAffineExpression([(vars[a], costs[a]) for a in Arcs]),
+    "Total Cost of Transport",
+)
+
+# Lists the route variables entering and leaving each node
+inArcs = {n: [] for n in Nodes}
+outArcs = {n: [] for n in Nodes}
+for i, j in Arcs:
+    outArcs[i].append(vars[(i, j)])
+    inArcs[j].append(vars[(i, j)])
 
 # Creates all problem constraints - this ensures the amount going into each node is at least equal to the amount leaving
 for n in Nodes:
     prob += (
-        supply[n] + lpSum([vars[(i, j)] for (i, j) in Arcs if j == n])
-        >= demand[n] + lpSum([vars[(i, j)] for (i, j) in Arcs if i == n])
+        supply[n] + lpSum(inArcs[n]) >= demand[n] + lpSum(outArcs[n])
     ), f"Steel Flow Conservation in Node {n}"
 
 # The problem data is written to an .lp file
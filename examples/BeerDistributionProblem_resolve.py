@@ -33,21 +33,22 @@ costs = [  # Bars
     [3, 1, 3, 2, 3],  # B
 ]
 
-# The cost data is made into a dictionary
-costs = makeDict([Warehouses, Bars], costs, 0)
-
 # Creates the 'prob' variable to contain the problem data
 prob = LpProblem("Beer Distribution Problem", LpMinimize)
 
-# Creates a list of tuples containing all the possible routes for transport
-Routes = [(w, b) for w in Warehouses for b in Bars]
-
 # A dictionary called 'Vars' is created to contain the referenced variables(the routes)
 vars = LpVariable.dicts("Route", (Warehouses, Bars), 0, None, LpInteger)
 
-# The objective function is added to 'prob' first
+# The objective function is added to 'prob' first, pairing each route with the
+# matching entry of the cost table
 prob += (
-    lpSum([vars[w][b] * costs[w][b] for (w, b) in Routes]),
+    LpAffineExpression(
+        [
+            (vars[w][b], cost)
+            for w, row in zip(Warehouses, costs)
+            for b, cost in zip(Bars, row)
+        ]
+    ),
     "Sum_of_Transporting_Costs",
 )
 
@@ -68,15 +69,18 @@ for b in Bars:
 
 # The problem data is written to an .lp file
 prob.writeLP("BeerDistributionProblem.lp")
-for demand in range(500, 601, 10):
+
+# The previous solution is offered to CBC as a MIP start
+solver = PULP_CBC_CMD(msg=False, warmStart=True)
+for demand_value in range(500, 601, 10):
     # reoptimise the problem by increasing demand at bar '1'
     # note the constant is stored as the LHS constant not the RHS of the constraint
-    bar_demand_constraint["1"].constant = -demand
+    bar_demand_constraint["1"].constant = -demand_value
     # or alternatively,
-    # prob.constraints["Sum_of_Products_into_Bar_1"].constant = - demand
+    # prob.constraints["Sum_of_Products_into_Bar_1"].constant = - demand_value
 
-    # The problem is solved using PuLP's choice of Solver
-    prob.solve()
+    # CBC only uses the MIP start while it is still feasible for the new demand
+    prob.solve(solver)
 
     # The status of the solution is printed to the screen
     print("Status:", LpStatus[prob.status])
@@ -1,6 +1,10 @@
 """
 Column Generation Functions
 
+The master problem is rebuilt from the full list of patterns on every
+iteration. CGcolumnwise.py keeps the master problem between iterations
+and adds each new pattern as a single column instead.
+
 Authors: Antony Phillips,  Dr Stuart Mitchell  2008
 """
 
@@ -16,19 +20,21 @@ class Pattern:
     cost = 1
     trimValue = 0.04
     totalRollLength = 20
-    lenOpts = ["5", "7", "9"]
+    lenOpts = [5, 7, 9]
 
     def __init__(self, name, lengths=None):
         self.name = name
         self.lengthsdict = dict(zip(self.lenOpts, lengths))
+        # the trim never changes, so it is worked out once here
+        self._trim = Pattern.totalRollLength - sum(
+            l * n for l, n in self.lengthsdict.items()
+        )
 
     def __str__(self):
         return self.name
 
     def trim(self):
-        return Pattern.totalRollLength - sum(
-            [int(i) * int(self.lengthsdict[i]) for i in self.lengthsdict]
-        )
+        return self._trim
 
 
 def masterSolve(Patterns, rollData, relax=True):
@@ -50,16 +56,17 @@ def masterSolve(Patterns, rollData, relax=True):
 
     # The objective function is entered: (the total number of large rolls used * the cost of each) -
     # (the value of the surplus stock) - (the value of the trim)
-    prob += (
-        lpSum([pattVars[i] * Pattern.cost for i in Patterns])
-        - lpSum([surplusVars[i] * surplusPrice[i] for i in Pattern.lenOpts])
-        - lpSum([pattVars[i] * i.trim() * Pattern.trimValue for i in Patterns])
-    )
+    objTerms = {
+        pattVars[i]: Pattern.cost - i.trim() * Pattern.trimValue for i in Patterns
+    }
+    objTerms.update({surplusVars[i]: -surplusPrice[i] for i in Pattern.lenOpts})
+    prob += LpAffineExpression(objTerms)
 
     # The demand minimum constraint is entered
     for j in Pattern.lenOpts:
         prob += (
-            lpSum([pattVars[i] * i.lengthsdict[j] for i in Patterns]) - surplusVars[j]
+            lpSum(pattVars[i] * i.lengthsdict[j] for i in Patterns if i.lengthsdict[j])
+            - surplusVars[j]
             >= rollDemand[j],
             f"Min{j}",
         )
@@ -67,22 +74,21 @@ def masterSolve(Patterns, rollData, relax=True):
     # The problem is solved
     prob.solve()
 
-    # The variable values are rounded
-    prob.roundSolution()
-
     if relax:
         # Creates a dual variables list
         duals = {}
-        for name, i in zip(["Min5", "Min7", "Min9"], Pattern.lenOpts):
-            duals[i] = prob.constraints[name].pi
+        for i in Pattern.lenOpts:
+            duals[i] = prob.constraints[f"Min{i}"].pi
 
         return duals
 
     else:
+        # The variable values are rounded
+        prob.roundSolution()
+
         # Creates a dictionary of the variables and their values
-        varsdict = {}
-        for v in prob.variables():
-            varsdict[v.name] = v.varValue
+        varsdict = {v.name: v.varValue for v in pattVars.values()}
+        varsdict.update({v.name: v.varValue for v in surplusVars.values()})
 
         # The number of rolls of each length in each pattern is printed
         for i in Patterns:
@@ -107,7 +113,7 @@ def subSolve(Patterns, duals):
 
     # The conservation of length constraint is entered
     prob += (
-        lpSum([_vars[i] * int(i) for i in Pattern.lenOpts]) + trim
+        lpSum([_vars[i] * i for i in Pattern.lenOpts]) + trim
         == Pattern.totalRollLength,
         "lengthEquate",
     )
@@ -115,24 +121,14 @@ def subSolve(Patterns, duals):
     # The problem is solved
     prob.solve()
 
-    # The variable values are rounded
-    prob.roundSolution()
-
-    # The new pattern is written to a dictionary
-    varsdict = {}
-    newPattern = {}
-    for v in prob.variables():
-        varsdict[v.name] = v.varValue
-    for i, j in zip(
-        Pattern.lenOpts, ["Roll_Length_5", "Roll_Length_7", "Roll_Length_9"]
-    ):
-        newPattern[i] = int(varsdict[j])
+    # The new pattern is written to a dictionary, rounding off any solver noise
+    newPattern = {i: int(_vars[i].varValue + 0.5) for i in Pattern.lenOpts}
 
     # Check if there are more patterns which would reduce the master LP objective function further
     if value(prob.objective) < -(10**-5):
         morePatterns = True  # continue adding patterns
         Patterns += [
-            Pattern("P" + str(len(Patterns)), [newPattern[i] for i in ["5", "7", "9"]])
+            Pattern("P" + str(len(Patterns)), [newPattern[i] for i in Pattern.lenOpts])
         ]
     else:
         morePatterns = False  # all patterns have been added
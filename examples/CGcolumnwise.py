@@ -16,28 +16,30 @@ class Pattern:
     cost = 1
     trimValue = 0.04
     totalRollLength = 20
-    lenOpts = ["5", "7", "9"]
+    lenOpts = [5, 7, 9]
     numPatterns = 0
 
     def __init__(self, name, lengths=None):
         self.name = name
         self.lengthsdict = dict(zip(self.lenOpts, lengths))
+        # the trim never changes, so it is worked out once here
+        self._trim = Pattern.totalRollLength - sum(
+            l * n for l, n in self.lengthsdict.items()
+        )
         Pattern.numPatterns += 1
 
     def __str__(self):
         return self.name
 
     def trim(self):
-        return Pattern.totalRollLength - sum(
-            [int(i) * int(self.lengthsdict[i]) for i in self.lengthsdict]
-        )
+        return self._trim
 
 
 def createMaster():
     rollData = {  # Length Demand SalePrice
-        "5": [150, 0.25],
-        "7": [200, 0.33],
-        "9": [300, 0.40],
+        5: [150, 0.25],
+        7: [200, 0.33],
+        9: [300, 0.40],
     }
 
     (rollDemand, surplusPrice) = splitDict(rollData)
@@ -52,7 +54,7 @@ def createMaster():
     # The constraints are initialised and added to prob
     constraints = {}
     for l in Pattern.lenOpts:
-        constraints[l] = LpConstraintVar("Min" + str(l), LpConstraintGE, rollDemand[l])
+        constraints[l] = LpConstraintVar(f"Min{l}", LpConstraintGE, rollDemand[l])
         prob += constraints[l]
 
     # The surplus variables are created
@@ -60,7 +62,7 @@ def createMaster():
     for i in Pattern.lenOpts:
         surplusVars += [
             LpVariable(
-                "Surplus " + i,
+                f"Surplus {i}",
                 0,
                 None,
                 LpContinuous,
@@ -77,12 +79,9 @@ def addPatterns(obj, constraints, newPatterns):
     Patterns = []
     for i in newPatterns:
         # The new patterns are checked to see that their length does not exceed
-        # the total roll length
-        lsum = 0
-        for j, k in zip(i, Pattern.lenOpts):
-            lsum += j * int(k)
-        if lsum > Pattern.totalRollLength:
-            raise ("Length Options too large for Roll")
+        # the total roll length, i.e. that they do not leave a negative trim
+        if Pattern.totalRollLength - sum(j * k for j, k in zip(i, Pattern.lenOpts)) < 0:
+            raise PulpError("Length Options too large for Roll")
 
         # The number of rolls of each length in each new pattern is printed
         print("P" + str(Pattern.numPatterns), "=", i)
@@ -93,39 +92,41 @@ def addPatterns(obj, constraints, newPatterns):
     # The pattern variables are created
     pattVars = []
     for i in Patterns:
-        pattVars += [
-            LpVariable(
-                "Pattern " + i.name,
-                0,
-                None,
-                LpContinuous,
-                (i.cost - Pattern.trimValue * i.trim()) * obj
-                + lpSum([constraints[l] * i.lengthsdict[l] for l in Pattern.lenOpts]),
-            )
-        ]
+        # The column holds the pattern's coefficient in the objective and in
+        # each demand constraint it contributes to
+        column = {obj: i.cost - Pattern.trimValue * i.trim()}
+        column.update(
+            {
+                constraints[l]: i.lengthsdict[l]
+                for l in Pattern.lenOpts
+                if i.lengthsdict[l]
+            }
+        )
+        pattVars += [LpVariable("Pattern " + i.name, 0, None, LpContinuous, column)]
 
 
 def masterSolve(prob, relax=True):
-    # Unrelaxes the Integer Constraint
-    if not relax:
-        for v in prob.variables():
-            v.cat = LpInteger
-
-    # The problem is solved and rounded
-    prob.solve(PULP_CBC_CMD())
-    prob.roundSolution()
-
     if relax:
+        # The problem is solved
+        prob.solve(PULP_CBC_CMD())
+
         # A dictionary of dual variable values is returned
         duals = {}
-        for i, name in zip(Pattern.lenOpts, ["Min5", "Min7", "Min9"]):
-            duals[i] = prob.constraints[name].pi
+        for i in Pattern.lenOpts:
+            duals[i] = prob.constraints[f"Min{i}"].pi
         return duals
     else:
+        # Unrelaxes the Integer Constraint
+        variables = prob.variables()
+        for v in variables:
+            v.cat = LpInteger
+
+        # The problem is solved and the variable values are rounded
+        prob.solve(PULP_CBC_CMD())
+        prob.roundSolution()
+
         # A dictionary of variable values and the objective value are returned
-        varsdict = {}
-        for v in prob.variables():
-            varsdict[v.name] = v.varValue
+        varsdict = {v.name: v.varValue for v in variables}
 
         return value(prob.objective), varsdict
 
@@ -146,30 +147,17 @@ def subSolve(duals):
 
     # The conservation of length constraint is entered
     prob += (
-        lpSum([vars[i] * int(i) for i in Pattern.lenOpts]) + trim
-        == Pattern.totalRollLength,
+        lpSum([vars[i] * i for i in Pattern.lenOpts]) + trim == Pattern.totalRollLength,
         "lengthEquate",
     )
 
     # The problem is solved
     prob.solve()
 
-    # The variable values are rounded
-    prob.roundSolution()
-
     newPatterns = []
     # Check if there are more patterns which would reduce the master LP objective function further
     if value(prob.objective) < -(10**-5):
-        varsdict = {}
-        for v in prob.variables():
-            varsdict[v.name] = v.varValue
         # Adds the new pattern to the newPatterns list
-        newPatterns += [
-            [
-                int(varsdict["Roll_Length_5"]),
-                int(varsdict["Roll_Length_7"]),
-                int(varsdict["Roll_Length_9"]),
-            ]
-        ]
+        newPatterns += [[int(vars[i].varValue + 0.5) for i in Pattern.lenOpts]]
 
     return newPatterns
@@ -39,15 +39,9 @@ costs = [  # Stores
     [9, 8, 6, 5],  # DE
 ]
 
-# Creates a list of tuples containing all the possible routes for transport
-Routes = [(p, s) for p in Plants for s in Stores]
-
 # Splits the dictionaries to be more understandable
 (supply, fixedCost) = splitDict(supplyData)
 
-# The cost data is made into a dictionary
-costs = makeDict([Plants, Stores], costs, 0)
-
 # Creates the problem variables of the Flow on the Arcs
 flow = LpVariable.dicts("Route", (Plants, Stores), 0, None, LpInteger)
 
@@ -58,16 +52,23 @@ build = LpVariable.dicts("BuildaPlant", Plants, 0, 1, LpInteger)
 prob = LpProblem("Computer Plant Problem", LpMinimize)
 
 # The objective function is added to prob - The sum of the transportation costs and the building fixed costs
+# Each route is paired with the matching entry of the cost table
 prob += (
-    lpSum([flow[p][s] * costs[p][s] for (p, s) in Routes])
-    + lpSum([fixedCost[p] * build[p] for p in Plants]),
+    LpAffineExpression(
+        [
+            (flow[p][s], cost)
+            for p, row in zip(Plants, costs)
+            for s, cost in zip(Stores, row)
+        ]
+        + [(build[p], fixedCost[p]) for p in Plants]
+    ),
     "Total Costs",
 )
 
 # The Supply maximum constraints are added for each supply node (plant)
 for p in Plants:
     prob += (
-        lpSum([flow[p][s] for s in Stores]) <= supply[p] * build[p],
+        lpSum(flow[p].values()) <= supply[p] * build[p],
         f"Sum of Products out of Plant {p}",
     )
 
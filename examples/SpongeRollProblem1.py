@@ -22,9 +22,6 @@ patterns = [[0, 2, 2], [1, 1, 0], [1, 0, 1]]  # A B C  # 5  # 7  # 9
 # The cost of each 20cm long sponge roll used
 cost = 1
 
-# The pattern data is made into a dictionary
-patterns = makeDict([LenOpts, PatternNames], patterns, 0)
-
 # The problem variables of the number of each pattern to make are created
 vars = LpVariable.dicts("Patt", PatternNames, 0, None, LpInteger)
 
@@ -34,10 +31,11 @@ prob = LpProblem("Cutting Stock Problem", LpMinimize)
 # The objective function is entered: the total number of large rolls used * the fixed cost of each
 prob += lpSum([vars[i] * cost for i in PatternNames]), "Production Cost"
 
-# The demand minimum constraint is entered
-for i in LenOpts:
+# The demand minimum constraint is entered, reading each length's row of the
+# pattern data
+for i, row in zip(LenOpts, patterns):
     prob += (
-        lpSum([vars[j] * patterns[i][j] for j in PatternNames]) >= rollDemand[i],
+        lpSum([vars[j] * n for j, n in zip(PatternNames, row)]) >= rollDemand[i],
         f"Ensuring enough {i} cm rolls",
     )
 
@@ -34,9 +34,6 @@ trimValue = 0.04
 # The rollData is made into separate dictionaries
 (rollDemand, surplusPrice) = splitDict(rollData)
 
-# The pattern data is made into a dictionary
-patterns = makeDict([LenOpts, PatternNames], patterns, 0)
-
 # The problem variables of the number of each pattern to make are created
 pattVars = LpVariable.dicts("Patt", PatternNames, 0, None, LpInteger)
 
@@ -55,10 +52,11 @@ prob += (
     "Net Production Cost",
 )
 
-# The demand minimum constraint is entered
-for i in LenOpts:
+# The demand minimum constraint is entered, reading each length's row of the
+# pattern data
+for i, row in zip(LenOpts, patterns):
     prob += (
-        lpSum([pattVars[j] * patterns[i][j] for j in PatternNames]) - surplusVars[i]
+        lpSum([pattVars[j] * n for j, n in zip(PatternNames, row)]) - surplusVars[i]
         >= rollDemand[i],
         f"Ensuring enough {i} cm rolls",
     )
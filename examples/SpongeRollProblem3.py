@@ -7,33 +7,48 @@ Authors: Antony Phillips, Dr Stuart Mitchell    2007
 
 def calculatePatterns(totalRollLength, lenOpts, head):
     """
-    Recursively calculates the list of options lists for a cutting stock problem. The input
-    'tlist' is a pointer, and will be the output of the function call.
+    Calculates the list of options lists for a cutting stock problem. The
+    patterns are counted through like an odometer, the last cutting option
+    turning over fastest, so no intermediate lists are built.
 
     The inputs are:
     totalRollLength - the length of the roll
     lenOpts - a list of the sizes of remaining cutting options
-    head - the current list that has been passed down though the recusion
+    head - the list of repetitions already chosen, put in front of every pattern
 
     Returns the list of patterns
 
     Authors: Bojan Blazevic, Dr Stuart Mitchell    2007
     """
-    if lenOpts:
-        patterns = []
-        # take the first option off lenOpts
-        opt = lenOpts[0]
-        for rep in range(int(totalRollLength / opt) + 1):
-            # reduce the length
-            l = totalRollLength - rep * opt
-            h = head[:]
-            h.append(rep)
-
-            patterns.extend(calculatePatterns(l, lenOpts[1:], h))
-    else:
-        # end of the recursion
-        patterns = [head]
-    return patterns
+    n = len(lenOpts)
+    reps = [0] * n
+    # left[i] is the length of roll left over once the first i options are cut
+    left = [totalRollLength] * (n + 1)
+    # top[i] is the most repetitions of option i that fit in left[i]
+    top = [0] * n
+    patterns = []
+    i = 0
+    while True:
+        # start every option from i onwards at no repetitions
+        while i < n:
+            top[i] = int(left[i] / lenOpts[i])
+            if top[i] < 0:
+                break
+            reps[i] = 0
+            left[i + 1] = left[i]
+            i += 1
+        if i == n:
+            patterns.append(head + reps)
+        # find the last option that can still be cut once more
+        i -= 1
+        while i >= 0 and reps[i] == top[i]:
+            i -= 1
+        if i < 0:
+            return patterns
+        # cut one more of it, working out the length left from the option before
+        reps[i] += 1
+        left[i + 1] = left[i] - reps[i] * lenOpts[i]
+        i += 1
 
 
 def makePatterns(totalRollLength, lenOpts):
@@ -51,18 +66,14 @@ def makePatterns(totalRollLength, lenOpts):
     patterns = calculatePatterns(totalRollLength, lenOpts, [])
 
     # The list 'PatternNames' is created
-    PatternNames = []
-    for i in range(len(patterns)):
-        PatternNames += ["P" + str(i)]
+    PatternNames = [f"P{i}" for i in range(len(patterns))]
 
     # The amount of trim (unused material) for each pattern is calculated and added to the dictionary
     # 'trim', with the reference key of the pattern name.
-    trim = {}
-    for name, pattern in zip(PatternNames, patterns):
-        ssum = 0
-        for rep, l in zip(pattern, lenOpts):
-            ssum += rep * l
-        trim[name] = totalRollLength - ssum
+    trim = {
+        name: totalRollLength - sum(rep * l for rep, l in zip(pattern, lenOpts))
+        for name, pattern in zip(PatternNames, patterns)
+    }
     # The different cutting lengths are printed, and the number of each roll of that length in each
     # pattern is printed below. This is so the user can see what each pattern contains.
     print(f"Lens: {lenOpts}")
@@ -103,10 +114,6 @@ rollData = {  # Length Demand SalePrice
 # The RollData is made into separate dictionaries
 (rollDemand, surplusPrice) = splitDict(rollData)
 
-# The pattern data  is made into a dictionary so it can be called by patterns["7"]["P3"] for example.
-# This will return the number of rolls of length "7" in pattern "P3"
-patterns = makeDict([PatternNames, LenOpts], patterns, 0)
-
 # The variable 'prob' is created
 prob = LpProblem("Cutting Stock Problem", LpMinimize)
 
@@ -117,17 +124,16 @@ pattVars = LpVariable.dicts("Patt", PatternNames, 0, None, LpInteger)
 surplusVars = LpVariable.dicts("Surp", LenOpts, 0, None, LpInteger)
 
 # The objective function is entered: (the total number of large rolls used * the cost of each) - (the value of the surplus stock) - (the value of the trim)
-prob += (
-    lpSum([pattVars[i] * cost for i in PatternNames])
-    - lpSum([surplusVars[i] * surplusPrice[i] for i in LenOpts])
-    - lpSum([pattVars[i] * trim[i] * trimValue for i in PatternNames]),
-    "Net Production Cost",
-)
+objTerms = {pattVars[i]: cost - trim[i] * trimValue for i in PatternNames}
+objTerms.update({surplusVars[i]: -surplusPrice[i] for i in LenOpts})
+prob += LpAffineExpression(objTerms), "Net Production Cost"
 
-# The demand minimum constraint is entered
-for j in LenOpts:
+# The demand minimum constraint is entered. zip(*patterns) gives, for each length, the
+# number of rolls of that length in every pattern; patterns without any are skipped
+for j, counts in zip(LenOpts, zip(*patterns)):
     prob += (
-        lpSum([pattVars[i] * patterns[i][j] for i in PatternNames]) - surplusVars[j]
+        lpSum([pattVars[i] * n for i, n in zip(PatternNames, counts) if n])
+        - surplusVars[j]
         >= rollDemand[j],
         f"Ensuring enough {j} cm rolls",
     )
@@ -7,33 +7,48 @@ Authors: Antony Phillips, Dr Stuart Mitchell    2007
 
 def calculatePatterns(totalRollLength, lenOpts, head):
     """
-    Recursively calculates the list of options lists for a cutting stock problem. The input
-    'tlist' is a pointer, and will be the output of the function call.
+    Calculates the list of options lists for a cutting stock problem. The
+    patterns are counted through like an odometer, the last cutting option
+    turning over fastest, so no intermediate lists are built.
 
     The inputs are:
     totalRollLength - the length of the roll
     lenOpts - a list of the sizes of remaining cutting options
-    head - the current list that has been passed down though the recusion
+    head - the list of repetitions already chosen, put in front of every pattern
 
     Returns the list of patterns
 
     Authors: Bojan Blazevic, Dr Stuart Mitchell    2007
     """
-    if lenOpts:
-        patterns = []
-        # take the first option off lenOpts
-        opt = lenOpts[0]
-        for rep in range(int(totalRollLength / opt) + 1):
-            # reduce the length
-            l = totalRollLength - rep * opt
-            h = head[:]
-            h.append(rep)
-
-            patterns.extend(calculatePatterns(l, lenOpts[1:], h))
-    else:
-        # end of the recursion
-        patterns = [head]
-    return patterns
+    n = len(lenOpts)
+    reps = [0] * n
+    # left[i] is the length of roll left over once the first i options are cut
+    left = [totalRollLength] * (n + 1)
+    # top[i] is the most repetitions of option i that fit in left[i]
+    top = [0] * n
+    patterns = []
+    i = 0
+    while True:
+        # start every option from i onwards at no repetitions
+        while i < n:
+            top[i] = int(left[i] / lenOpts[i])
+            if top[i] < 0:
+                break
+            reps[i] = 0
+            left[i + 1] = left[i]
+            i += 1
+        if i == n:
+            patterns.append(head + reps)
+        # find the last option that can still be cut once more
+        i -= 1
+        while i >= 0 and reps[i] == top[i]:
+            i -= 1
+        if i < 0:
+            return patterns
+        # cut one more of it, working out the length left from the option before
+        reps[i] += 1
+        left[i + 1] = left[i] - reps[i] * lenOpts[i]
+        i += 1
 
 
 def makePatterns(totalRollLength, lenOpts):
@@ -51,15 +66,12 @@ def makePatterns(totalRollLength, lenOpts):
     patternslist = calculatePatterns(totalRollLength, lenOpts, [])
 
     # The list 'PatternNames' is created
-    PatternNames = []
-    for i in range(len(patternslist)):
-        PatternNames += ["P" + str(i)]
+    PatternNames = [f"P{i}" for i in range(len(patternslist))]
 
-    # Patterns = [0 for i in range(len(PatternNames))]
-    Patterns = []
-
-    for i, j in enumerate(PatternNames):
-        Patterns += [Pattern(j, patternslist[i])]
+    # The patterns are instantiated as Pattern objects
+    Patterns = [
+        Pattern(name, pattern) for name, pattern in zip(PatternNames, patternslist)
+    ]
 
     # The different cutting lengths are printed, and the number of each roll of that length in each
     # pattern is printed below. This is so the user can see what each pattern contains.
@@ -83,14 +95,16 @@ class Pattern:
     def __init__(self, name, lengths=None):
         self.name = name
         self.lengthsdict = dict(zip(self.lenOpts, lengths))
+        # the trim never changes, so it is worked out once here
+        self._trim = Pattern.totalRollLength - sum(
+            l * n for l, n in self.lengthsdict.items()
+        )
 
     def __str__(self):
         return self.name
 
     def trim(self):
-        return Pattern.totalRollLength - sum(
-            [int(i) * self.lengthsdict[i] for i in self.lengthsdict]
-        )
+        return self._trim
 
 
 # Import PuLP modeler functions
@@ -116,12 +130,9 @@ pattVars = LpVariable.dicts("Patt", Patterns, 0, None, LpInteger)
 surplusVars = LpVariable.dicts("Surp", Pattern.lenOpts, 0, None, LpInteger)
 
 # The objective function is entered: (the total number of large rolls used * the cost of each) - (the value of the surplus stock) - (the value of the trim)
-prob += (
-    lpSum([pattVars[i] * Pattern.cost for i in Patterns])
-    - lpSum([surplusVars[i] * surplusPrice[i] for i in Pattern.lenOpts])
-    - lpSum([pattVars[i] * i.trim() * Pattern.trimValue for i in Patterns]),
-    "Net Production Cost",
-)
+objTerms = {pattVars[i]: Pattern.cost - i.trim() * Pattern.trimValue for i in Patterns}
+objTerms.update({surplusVars[i]: -surplusPrice[i] for i in Pattern.lenOpts})
+prob += LpAffineExpression(objTerms), "Net Production Cost"
 
 # The demand minimum constraint is entered
 for j in Pattern.lenOpts:
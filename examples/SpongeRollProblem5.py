@@ -9,16 +9,20 @@ from .CG import *
 
 # The roll data is created
 rollData = {  # Length Demand SalePrice
-    "5": [150, 0.25],
-    "7": [200, 0.33],
-    "9": [300, 0.40],
+    5: [150, 0.25],
+    7: [200, 0.33],
+    9: [300, 0.40],
 }
 
 # The boolean variable morePatterns is set to True to test for more patterns
 morePatterns = True
 
-# A list of starting patterns is created
-patternslist = [[4, 0, 0], [0, 2, 0], [0, 0, 2]]
+# A list of starting patterns is created, each one cutting as many rolls of a
+# single length as will fit
+patternslist = [
+    [Pattern.totalRollLength // l if k == l else 0 for k in Pattern.lenOpts]
+    for l in Pattern.lenOpts
+]
 
 # The starting patterns are instantiated with the Pattern class
 Patterns = []
@@ -29,18 +29,18 @@ choices = LpVariable.dicts("Choice", (VALS, ROWS, COLS), cat="Binary")
 # A constraint ensuring that only one value can be in each square is created
 for r in ROWS:
     for c in COLS:
-        prob += lpSum([choices[v][r][c] for v in VALS]) == 1
+        prob += lpSum(choices[v][r][c] for v in VALS) == 1
 
 # The row, column and box constraints are added for each value
 for v in VALS:
     for r in ROWS:
-        prob += lpSum([choices[v][r][c] for c in COLS]) == 1
+        prob += lpSum(choices[v][r][c] for c in COLS) == 1
 
     for c in COLS:
-        prob += lpSum([choices[v][r][c] for r in ROWS]) == 1
+        prob += lpSum(choices[v][r][c] for r in ROWS) == 1
 
     for b in Boxes:
-        prob += lpSum([choices[v][r][c] for (r, c) in b]) == 1
+        prob += lpSum(choices[v][r][c] for (r, c) in b) == 1
 
 # The starting numbers are entered as constraints
 input_data = [
@@ -29,18 +29,18 @@ choices = LpVariable.dicts("Choice", (VALS, ROWS, COLS), cat="Binary")
 # A constraint ensuring that only one value can be in each square is created
 for r in ROWS:
     for c in COLS:
-        prob += lpSum([choices[v][r][c] for v in VALS]) == 1
+        prob += lpSum(choices[v][r][c] for v in VALS) == 1
 
 # The row, column and box constraints are added for each value
 for v in VALS:
     for r in ROWS:
-        prob += lpSum([choices[v][r][c] for c in COLS]) == 1
+        prob += lpSum(choices[v][r][c] for c in COLS) == 1
 
     for c in COLS:
-        prob += lpSum([choices[v][r][c] for r in ROWS]) == 1
+        prob += lpSum(choices[v][r][c] for r in ROWS) == 1
 
     for b in Boxes:
-        prob += lpSum([choices[v][r][c] for (r, c) in b]) == 1
+        prob += lpSum(choices[v][r][c] for (r, c) in b) == 1
 
 # The starting numbers are entered as constraints
 input_data = [
@@ -108,13 +108,11 @@ while True:
         # The constraint is added that the same solution cannot be returned again
         prob += (
             lpSum(
-                [
-                    choices[v][r][c]
-                    for v in VALS
-                    for r in ROWS
-                    for c in COLS
-                    if value(choices[v][r][c]) == 1
-                ]
+                choices[v][r][c]
+                for v in VALS
+                for r in ROWS
+                for c in COLS
+                if value(choices[v][r][c]) == 1
             )
             <= 80
         )
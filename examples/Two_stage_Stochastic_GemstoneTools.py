@@ -47,11 +47,10 @@ plierearnings = [100, 100, 100, 100]
 capassembly = [8, 10, 8, 10]
 
 production = [(j, i) for j in scenarios for i in products]
-pricescenario = [[wrenchearnings[j], plierearnings[j]] for j in scenarios]
-priceitems = [item for sublist in pricescenario for item in sublist]
+earnings = dict(zip(products, [wrenchearnings, plierearnings]))
 
 # create dictionaries for the parameters
-price_dict = dict(zip(production, priceitems))
+price_dict = {(j, i): earnings[i][j] for (j, i) in production}
 capacity_dict = dict(zip(products, capacity_ub * 4))
 steel_dict = dict(zip(products, steel))
 molding_dict = dict(zip(products, molding))
@@ -68,30 +67,41 @@ gemstoneprob = pulp.LpProblem("The Gemstone Tool Problem", pulp.LpMaximize)
 
 # The objective function is added to 'gemstoneprob' first
 gemstoneprob += (
-    pulp.lpSum(
+    pulp.LpAffineExpression(
         [
-            pscenario[j] * (price_dict[(j, i)] * production_vars[j][i])
+            (production_vars[j][i], pscenario[j] * price_dict[(j, i)])
             for (j, i) in production
         ]
-        - steelpurchase * steelprice
+        + [(steelpurchase, -steelprice)]
     ),
     "Total cost",
 )
 
 for j in scenarios:
-    gemstoneprob += pulp.lpSum(
-        [steel_dict[i] * production_vars[j][i] for i in products]
-    ) - steelpurchase <= 0, ("Steel capacity" + str(j))
-    gemstoneprob += pulp.lpSum(
-        [molding_dict[i] * production_vars[j][i] for i in products]
-    ) <= capmolding, ("molding capacity" + str(j))
-    gemstoneprob += pulp.lpSum(
-        [assembly_dict[i] * production_vars[j][i] for i in products]
-    ) <= capassembly[j], ("assembly capacity" + str(j))
-    for i in products:
-        gemstoneprob += production_vars[j][i] <= capacity_dict[i], (
-            "capacity " + str(i) + str(j)
+    gemstoneprob += (
+        pulp.LpAffineExpression(
+            [(production_vars[j][i], steel_dict[i]) for i in products]
+        )
+        - steelpurchase
+        <= 0,
+        f"Steel capacity{j}",
+    )
+    gemstoneprob += (
+        pulp.LpAffineExpression(
+            [(production_vars[j][i], molding_dict[i]) for i in products]
         )
+        <= capmolding,
+        f"molding capacity{j}",
+    )
+    gemstoneprob += (
+        pulp.LpAffineExpression(
+            [(production_vars[j][i], assembly_dict[i]) for i in products]
+        )
+        <= capassembly[j],
+        f"assembly capacity{j}",
+    )
+    for i in products:
+        gemstoneprob += production_vars[j][i] <= capacity_dict[i], f"capacity {i}{j}"
 
 # Print problem
 print(gemstoneprob)
@@ -94,9 +94,9 @@ for t in time:
     prob += demand[t] == lpSum(p[t]) + ph[t]
 
 # Thermal production cost
-ctp = lpSum([lpSum([p[t][i] for t in time]) * costs[i] for i in unit])
+ctp = LpAffineExpression((p[t][i], costs[i]) for i in unit for t in time)
 # Startup costs
-cts = lpSum([lpSum([u[t][i] for t in time]) * startupcosts[i] for i in unit])
+cts = LpAffineExpression((u[t][i], startupcosts[i]) for i in unit for t in time)
 # The objective is the total cost
 prob += ctp + cts
 
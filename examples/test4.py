@@ -40,11 +40,16 @@ y = LpVariable.matrix("y", (S, N), 0, 1, LpInteger)
 lp = LpProblem("Planification", LpMinimize)
 
 # Objective: expected earnings
-lp += lpDot(x, c) - lpDot(q, y) / float(s)
+# built from (variable, coefficient) pairs, zero coefficients left out as lpDot does
+objective = [(x[i], c[i]) for i in N if c[i]]
+objective += [(y[j][i], -q[j][i] / float(s)) for j in S for i in N if q[j][i]]
+lp += LpAffineExpression(objective)
 
 # Resources constraints for each scenario
+firstYear = [(x[i], d[i]) for i in N if d[i]]
 for j in S:
-    lp += lpDot(d, x) + lpDot(delta[j], y[j]) <= B
+    secondYear = [(y[j][i], delta[j][i]) for i in N if delta[j][i]]
+    lp += LpAffineExpression(firstYear + secondYear) <= B
 
 # We can only finish a project that was started
 for i in N:
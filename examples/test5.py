@@ -37,7 +37,9 @@ prob += lpSum(s) + lpSum(w)
 # Constraints
 d = [[randint(0, D) for i in range(n)] for j in range(m)]
 for j in range(m):
-    prob += lpDot(d[j], x) + s[j] - w[j] == lpSum(d[j]) / 2
+    # each row is built from (variable, coefficient) pairs, dropping zeros as lpDot does
+    row = [(x[i], d[j][i]) for i in range(n) if d[j][i]]
+    prob += LpAffineExpression(row + [(s[j], 1), (w[j], -1)]) == sum(d[j]) / 2
 
 # Resolution
 prob.solve()
@@ -21,7 +21,7 @@ def happiness(table):
 
 
 # create list of all possible tables
-possible_tables = [tuple(c) for c in pulp.allcombinations(guests, max_table_size)]
+possible_tables = list(pulp.allcombinations(guests, max_table_size))
 
 # create a binary variable to state that a table setting is used
 x = pulp.LpVariable.dicts(
@@ -38,10 +38,16 @@ seating_model += (
     "Maximum_number_of_tables",
 )
 
+# the tables each guest could sit at, found in a single pass over the tables
+tables_by_guest = {guest: [] for guest in guests}
+for table in possible_tables:
+    for guest in table:
+        tables_by_guest[guest].append(table)
+
 # A guest must seated at one and only one table
 for guest in guests:
     seating_model += (
-        pulp.lpSum([x[table] for table in possible_tables if guest in table]) == 1,
+        pulp.LpAffineExpression((x[table], 1) for table in tables_by_guest[guest]) == 1,
         f"Must_seat_{guest}",
     )
 
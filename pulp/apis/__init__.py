@@ -40,17 +40,23 @@ _all_solvers = [
     SASCAS,
 ]
 
-import json
-
-# Default solver selection
-if PULP_CBC_CMD().available():
-    LpSolverDefault = PULP_CBC_CMD()
-elif GLPK_CMD().available():
-    LpSolverDefault = GLPK_CMD()
-elif COIN_CMD().available():
-    LpSolverDefault = COIN_CMD()
+# name lookup used by getSolver, built once
+_solvers_by_name = {k.name: k for k in _all_solvers}
+
+try:
+    import ujson as json
+except ImportError:
+    import json
+
+# Default solver selection: the first available one is kept
+for _solver_class in (PULP_CBC_CMD, GLPK_CMD, COIN_CMD):
+    _solver = _solver_class()
+    if _solver.available():
+        LpSolverDefault = _solver
+        break
 else:
     LpSolverDefault = None
+del _solver_class, _solver
 
 
 def setConfigInformation(**keywords):
@@ -104,15 +110,15 @@ def getSolver(solver, *args, **kwargs):
     :param kwargs: additional keyword arguments to the solver
     :return: solver of type :py:class:`LpSolver`
     """
-    mapping = {k.name: k for k in _all_solvers}
     try:
-        return mapping[solver](*args, **kwargs)
+        solver_class = _solvers_by_name[solver]
     except KeyError:
         raise PulpSolverError(
             "The solver {} does not exist in PuLP.\nPossible options are: \n{}".format(
-                solver, mapping.keys()
+                solver, _solvers_by_name.keys()
             )
         )
+    return solver_class(*args, **kwargs)
 
 
 def getSolverFromDict(data):
@@ -153,10 +159,6 @@ def listSolvers(onlyAvailable=False):
     :return: list of solver names
     :rtype: list
     """
-    result = []
-    for s in _all_solvers:
-        solver = s(msg=False)
-        if (not onlyAvailable) or solver.available():
-            result.append(solver.name)
-        del solver
-    return result
+    if not onlyAvailable:
+        return [s.name for s in _all_solvers]
+    return [s.name for s in _all_solvers if s(msg=False).available()]
@@ -62,6 +62,20 @@ class CHOCO_CMD(LpSolver_CMD):
             keepFiles=keepFiles,
         )
 
+    # TODO: figure out the unbounded status in choco solver
+    CHOCO_STATUSES = {
+        "OPTIMUM FOUND": (constants.LpStatusOptimal, constants.LpSolutionOptimal),
+        "SATISFIABLE": (
+            constants.LpStatusOptimal,
+            constants.LpSolutionIntegerFeasible,
+        ),
+        "UNSATISFIABLE": (
+            constants.LpStatusInfeasible,
+            constants.LpSolutionInfeasible,
+        ),
+        "UNKNOWN": (constants.LpStatusNotSolved, constants.LpSolutionNoSolutionFound),
+    }
+
     def defaultPath(self):
         return self.executableExtension("choco-parsers-with-dependencies.jar")
 
@@ -84,26 +98,24 @@ class CHOCO_CMD(LpSolver_CMD):
         lp.checkDuplicateVars()
 
         lp.writeMPS(tmpMps, mpsSense=lp.sense)
-        try:
-            os.remove(tmpSol)
-        except:
-            pass
-        cmd = java_path + ' -cp "' + self.path + '" org.chocosolver.parser.mps.ChocoMPS'
+        cmd = [java_path, "-cp", self.path, "org.chocosolver.parser.mps.ChocoMPS"]
         if self.timeLimit is not None:
-            cmd += f" -tl {self.timeLimit}" * 1000
-        cmd += " " + " ".join([f"{key} {value}" for key, value in self.options])
-        cmd += f" {tmpMps}"
+            # choco takes the time limit in milliseconds
+            cmd += ["-tl", str(int(self.timeLimit * 1000))]
+        for key, value in self.options:
+            cmd += [str(key), str(value)]
+        cmd.append(tmpMps)
         if lp.sense == constants.LpMaximize:
-            cmd += " -max"
+            cmd.append("-max")
         if lp.isMIP():
             if not self.mip:
                 warnings.warn("CHOCO_CMD cannot solve the relaxation of a problem")
         # we always get the output to a file.
         # if not, we cannot read it afterwards
-        # (we thus ignore the self.msg parameter)
-        pipe = open(tmpSol, "w")
-
-        return_code = subprocess.call(cmd, stdout=pipe, stderr=pipe, shell=True)
+        # (self.msg only decides whether the errors are shown)
+        stderr = None if self.msg else subprocess.DEVNULL
+        with open(tmpSol, "w") as pipe:
+            return_code = subprocess.call(cmd, stdout=pipe, stderr=stderr)
 
         if return_code != 0:
             raise PulpSolverError("PuLP: Error while trying to execute " + self.path)
@@ -124,35 +136,23 @@ class CHOCO_CMD(LpSolver_CMD):
     @staticmethod
     def readsol(filename):
         """Read a Choco solution file"""
-        # TODO: figure out the unbounded status in choco solver
-        chocoStatus = {
-            "OPTIMUM FOUND": constants.LpStatusOptimal,
-            "SATISFIABLE": constants.LpStatusOptimal,
-            "UNSATISFIABLE": constants.LpStatusInfeasible,
-            "UNKNOWN": constants.LpStatusNotSolved,
-        }
-
-        chocoSolStatus = {
-            "OPTIMUM FOUND": constants.LpSolutionOptimal,
-            "SATISFIABLE": constants.LpSolutionIntegerFeasible,
-            "UNSATISFIABLE": constants.LpSolutionInfeasible,
-            "UNKNOWN": constants.LpSolutionNoSolutionFound,
-        }
-
         status = constants.LpStatusNotSolved
         sol_status = constants.LpSolutionNoSolutionFound
         values = {}
+        first = True
         with open(filename) as f:
-            content = f.readlines()
-        content = [l.strip() for l in content if l[:2] not in ["o ", "c "]]
-        if not len(content):
-            return status, values, sol_status
-        if content[0][:2] == "s ":
-            status_str = content[0][2:]
-            status = chocoStatus[status_str]
-            sol_status = chocoSolStatus[status_str]
-        for line in content[1:]:
-            name, value = line.split()
-            values[name] = float(value)
+            for line in f:
+                # skip the objective and comment lines
+                if line[:2] in ["o ", "c "]:
+                    continue
+                line = line.strip()
+                # the first remaining line holds the status
+                if first:
+                    first = False
+                    if line[:2] == "s ":
+                        status, sol_status = CHOCO_CMD.CHOCO_STATUSES[line[2:]]
+                    continue
+                name, value = line.split()
+                values[name] = float(value)
 
         return status, values, sol_status
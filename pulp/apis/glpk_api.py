@@ -62,6 +62,23 @@ class GLPK_CMD(LpSolver_CMD):
             keepFiles=keepFiles,
         )
 
+    GLPK_STATUSES = {
+        "INTEGER OPTIMAL": constants.LpStatusOptimal,
+        "INTEGER NON-OPTIMAL": constants.LpStatusOptimal,
+        "OPTIMAL": constants.LpStatusOptimal,
+        "INFEASIBLE (FINAL)": constants.LpStatusInfeasible,
+        "INTEGER UNDEFINED": constants.LpStatusUndefined,
+        "UNBOUNDED": constants.LpStatusUnbounded,
+        "UNDEFINED": constants.LpStatusUndefined,
+        "INTEGER EMPTY": constants.LpStatusInfeasible,
+    }
+    INTEGER_STATUSES = {
+        "INTEGER NON-OPTIMAL",
+        "INTEGER OPTIMAL",
+        "INTEGER UNDEFINED",
+        "INTEGER EMPTY",
+    }
+
     def defaultPath(self):
         return self.executableExtension(glpk_path)
 
@@ -127,25 +144,10 @@ class GLPK_CMD(LpSolver_CMD):
             cols = int(f.readline().split()[1])
             f.readline()
             statusString = f.readline()[12:-1]
-            glpkStatus = {
-                "INTEGER OPTIMAL": constants.LpStatusOptimal,
-                "INTEGER NON-OPTIMAL": constants.LpStatusOptimal,
-                "OPTIMAL": constants.LpStatusOptimal,
-                "INFEASIBLE (FINAL)": constants.LpStatusInfeasible,
-                "INTEGER UNDEFINED": constants.LpStatusUndefined,
-                "UNBOUNDED": constants.LpStatusUnbounded,
-                "UNDEFINED": constants.LpStatusUndefined,
-                "INTEGER EMPTY": constants.LpStatusInfeasible,
-            }
-            if statusString not in glpkStatus:
+            if statusString not in self.GLPK_STATUSES:
                 raise PulpSolverError("Unknown status returned by GLPK")
-            status = glpkStatus[statusString]
-            isInteger = statusString in [
-                "INTEGER NON-OPTIMAL",
-                "INTEGER OPTIMAL",
-                "INTEGER UNDEFINED",
-                "INTEGER EMPTY",
-            ]
+            status = self.GLPK_STATUSES[statusString]
+            isInteger = statusString in self.INTEGER_STATUSES
             values = {}
             for i in range(4):
                 f.readline()
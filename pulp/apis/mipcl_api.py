@@ -91,13 +91,12 @@ class MIPCL_CMD(LpSolver_CMD):
             os.remove(tmpSol)
         except:
             pass
-        cmd = self.path
-        cmd += f" {tmpMps}"
-        cmd += f" -solfile {tmpSol}"
+        cmd = [self.path, tmpMps, "-solfile", tmpSol]
         if self.timeLimit is not None:
-            cmd += f" -time {self.timeLimit}"
+            cmd += ["-time", str(self.timeLimit)]
         for option in self.options:
-            cmd += " " + option
+            # an option may carry its value, as in "-threads 4"
+            cmd += option.split()
         if lp.isMIP():
             if not self.mip:
                 warnings.warn("MIPCL_CMD cannot solve the relaxation of a problem")
@@ -106,7 +105,7 @@ class MIPCL_CMD(LpSolver_CMD):
         else:
             pipe = open(os.devnull, "w")
 
-        return_code = subprocess.call(cmd.split(), stdout=pipe, stderr=pipe)
+        return_code = subprocess.call(cmd, stdout=pipe, stderr=pipe)
         # We need to undo the objective swap before finishing
         if lp.sense == constants.LpMaximize:
             lp += -lp.objective
@@ -824,6 +824,8 @@ class LpAffineExpression(_DICT_TYPE):
         """
         result = []
         line = [f"{name}:"]
+        # running length of line, so it is not summed again for every term
+        length = len(line[0])
         notFirst = 0
         variables = self.sorted_keys()
         for v in variables:
@@ -842,11 +844,13 @@ class LpAffineExpression(_DICT_TYPE):
                 # adding zero to val to remove instances of negative zero
                 term = f"{sign} {val + 0:.12g} {v.name}"
 
-            if self._count_characters(line) + len(term) > const.LpCplexLPLineSize:
+            if length + len(term) > const.LpCplexLPLineSize:
                 result += ["".join(line)]
                 line = [term]
+                length = len(term)
             else:
                 line += [term]
+                length += len(term)
         return result, line
 
     def asCplexLpAffineExpression(self, name, constant=1):
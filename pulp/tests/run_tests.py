@@ -1,7 +1,6 @@
 import unittest
 
 import pulp
-from pulp.tests import test_examples, test_gurobipy_env, test_pulp, test_sparse
 
 
 def pulpTestAll(test_docs=False):
@@ -18,6 +17,9 @@ def pulpTestAll(test_docs=False):
 
 
 def get_test_suite(test_docs: bool = False) -> unittest.TestSuite:
+    # imported here so that ``import pulp`` does not load the whole test suite
+    from pulp.tests import test_examples, test_gurobipy_env, test_pulp, test_sparse
+
     loader = unittest.TestLoader()
     suite_all = unittest.TestSuite()
 
@@ -10,7 +10,7 @@ from pulp.apis import *
 from pulp import LpVariable, LpProblem, lpSum, LpConstraintVar, LpFractionConstraint
 from pulp import constants as const
 from pulp.tests.bin_packing_problem import create_bin_packing_problem
-from pulp.utilities import makeDict
+from pulp.utilities import makeDict, splitDict
 import re
 import functools
 import unittest
@@ -1069,6 +1069,16 @@ class BaseSolverTest:
             _func = lambda: dict_without_default["X"]["Y"]
             self.assertRaises(KeyError, _func)
 
+        def test_splitDict(self):
+            """
+            Test if splitDict splits lists of uneven length by position.
+            """
+            data = {"A": [1, 2, 3], "B": [4], "C": [5, 6]}
+            first, second, third = splitDict(data)
+            self.assertEqual(first, {"A": 1, "B": 4, "C": 5})
+            self.assertEqual(second, {"A": 2, "C": 6})
+            self.assertEqual(third, {"A": 3})
+
         def test_importMPS_maximize(self):
             name = self._testMethodName
             prob = LpProblem(name, const.LpMaximize)
@@ -1401,6 +1411,43 @@ class BaseSolverTest:
             # it should be all None
             self.assertTrue(all(c is None for c in shadowPrices.values()))
 
+        def test_parse_choco_solution(self):
+            """
+            Ensures `readsol` can parse Choco solutions
+            """
+            from io import StringIO
+            from unittest import mock
+
+            # objective and comment lines come before the status line,
+            # variable names may start with the same letters
+            file_content = (
+                "o 12\n"
+                "c a comment\n"
+                "o 10\n"
+                "s OPTIMUM FOUND\n"
+                "x 1\n"
+                "cost_1 2.5\n"
+                "order_2 0\n"
+            )
+            with mock.patch(
+                "pulp.apis.choco_api.open",
+                return_value=StringIO(file_content),
+                create=True,
+            ):
+                status, values, sol_status = CHOCO_CMD.readsol("choco.sol")
+            self.assertEqual(status, const.LpStatusOptimal)
+            self.assertEqual(sol_status, const.LpSolutionOptimal)
+            self.assertEqual(values, {"x": 1.0, "cost_1": 2.5, "order_2": 0.0})
+
+            # an empty file means the problem was not solved
+            with mock.patch(
+                "pulp.apis.choco_api.open", return_value=StringIO(""), create=True
+            ):
+                status, values, sol_status = CHOCO_CMD.readsol("choco.sol")
+            self.assertEqual(status, const.LpStatusNotSolved)
+            self.assertEqual(sol_status, const.LpSolutionNoSolutionFound)
+            self.assertEqual(values, {})
+
         def test_options_parsing_SCIP_HIGHS(self):
             name = self._testMethodName
             prob = LpProblem(name, const.LpMinimize)
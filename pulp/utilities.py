@@ -134,14 +134,14 @@ def splitDict(data):
     :return: A tuple of dictionaries each containing the data separately,
             with the same dictionary keys
     """
-    # find the maximum number of items in the dictionary
-    maxitems = max([len(values) for values in data.values()])
-    output = [dict() for _ in range(maxitems)]
-    for key, values in data.items():
-        for i, val in enumerate(values):
-            output[i][key] = val
-
-    return tuple(output)
+    # transpose the lists, padding the shorter ones with a marker that is
+    # then left out of the dictionaries
+    keys = list(data)
+    missing = object()
+    return tuple(
+        {key: val for key, val in zip(keys, column) if val is not missing}
+        for column in itertools.zip_longest(*data.values(), fillvalue=missing)
+    )
 
 
 def read_table(data, coerce_type, transpose=False):